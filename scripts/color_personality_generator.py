@@ -14,16 +14,32 @@ Features:
 Usage:
     python color-personality-generator.py rustic
     python color-personality-generator.py --personality edgy --export css
+    python color-personality-generator.py rustic --seed 42
 """
 
 import sys
 import random
 import json
 import re
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+import functools
+import dataclasses
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+_HSL_RE = re.compile(r'hsl\((\d+),\s*(\d+)%,\s*(\d+)%\)')
+
+def _parse_hsl(hsl_str: str) -> Optional[Tuple[int, int, int]]:
+    match = _HSL_RE.match(hsl_str)
+    if match:
+        return int(match.group(1)), int(match.group(2)), int(match.group(3))
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _contrast_ratio(darker: int, lighter: int) -> float:
+    # Callers pass (min, max) so both orderings of a pair share one cache entry
+    return (lighter / 100 + 0.05) / (darker / 100 + 0.05)
+
 class Personality(Enum):
     RUSTIC = "rustic"
     EDGY = "edgy"
@@ -116,7 +132,29 @@ PERSONALITY_PSYCHOLOGY = {
     Personality.FOREST: "Grounded vitality, fresh growth. Users feel renewal and stability.",
 }
 
-@dataclass
+_CSS_TEMPLATE = """/* 🎨 {name} PALETTE */
+/* Psychology: {psychology} */
+
+:root {{
+  /* Light Mode (Default) */
+  --color-primary: {primary};
+  --color-accent: {accent};
+  --color-surface: {surface};
+  --color-text: {text};
+  --color-muted: {muted};
+}}
+
+@media (prefers-color-scheme: dark) {{
+  :root {{
+    --color-primary: {primary_dark};
+    --color-accent: {accent_dark};
+    --color-surface: {surface_dark};
+    --color-text: {text_dark};
+    --color-muted: {muted_dark};
+  }}
+}}"""
+
+@dataclass(frozen=True)
 class ColorPalette:
     personality: Personality
     primary: str
@@ -130,32 +168,34 @@ class ColorPalette:
     text_dark: str
     muted_dark: str
     psychology: str
-    contrast_ratios: Dict[str, float]
+    # Derived from the colors, so left out of eq/hash (which also keeps the palette hashable)
+    contrast_ratios: Dict[str, float] = field(compare=False)
 
 class ColorGenerator:
-    @staticmethod
-    def _generate_odd_value(min_val: int, max_val: int) -> int:
-        value = random.randint(min_val, max_val)
-        if value % 2 == 0:
-            value += 1 if value < max_val else -1
-        return value
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+    
+    def _generate_odd_value(self, min_val: int, max_val: int) -> int:
+        lo, hi = min_val // 2, (max_val - 1) // 2
+        if lo > hi:  # No odd value in range (e.g. BRUTALIST's zero saturation)
+            return min_val
+        return 2 * self._rng.randint(lo, hi) + 1
     
     @staticmethod
     def _hsl_to_string(h: int, s: int, l: int) -> str:
         return f"hsl({h}, {s}%, {l}%)"
     
-    @staticmethod
-    def _generate_color(h_range: int, s_range: Tuple[int, int], l_range: Tuple[int, int]) -> str:
+    def _generate_color(self, h_range: int, s_range: Tuple[int, int], l_range: Tuple[int, int]) -> str:
         h = h_range
-        s = ColorGenerator._generate_odd_value(s_range[0], s_range[1])
-        l = ColorGenerator._generate_odd_value(l_range[0], l_range[1])
+        s = self._generate_odd_value(s_range[0], s_range[1])
+        l = self._generate_odd_value(l_range[0], l_range[1])
         return ColorGenerator._hsl_to_string(h, s, l)
     
     @staticmethod
     def _darken_for_dark_mode(hsl_str: str, lightness_shift: int = -10, sat_shift: int = -10) -> str:
-        match = re.match(r'hsl\((\d+),\s*(\d+)%,\s*(\d+)%\)', hsl_str)
-        if match:
-            h, s, l = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        parsed = _parse_hsl(hsl_str)
+        if parsed:
+            h, s, l = parsed
             s = max(0, s + sat_shift)
             l = max(0, min(100, l + lightness_shift))
             return ColorGenerator._hsl_to_string(h, s, l)
@@ -163,41 +203,35 @@ class ColorGenerator:
     
     @staticmethod
     def _calculate_contrast(color1: str, color2: str) -> float:
-        def get_lightness(hsl_str):
-            match = re.match(r'hsl\((\d+),\s*(\d+)%,\s*(\d+)%\)', hsl_str)
-            return int(match.group(3)) if match else 50
-        l1 = get_lightness(color1) / 100
-        l2 = get_lightness(color2) / 100
-        lighter = max(l1, l2) + 0.05
-        darker = min(l1, l2) + 0.05
-        return lighter / darker
+        hsl1, hsl2 = _parse_hsl(color1), _parse_hsl(color2)
+        l1, l2 = hsl1[2] if hsl1 else 50, hsl2[2] if hsl2 else 50
+        return _contrast_ratio(min(l1, l2), max(l1, l2))
     
-    @staticmethod
-    def generate(personality: Personality) -> ColorPalette:
+    def generate(self, personality: Personality) -> ColorPalette:
         ranges = PERSONALITY_RANGES[personality]
-        primary = ColorGenerator._generate_color(*ranges['primary'])
-        accent = ColorGenerator._generate_color(*ranges['accent'])
-        surface = ColorGenerator._generate_color(*ranges['neutral'])
+        primary = self._generate_color(*ranges['primary'])
+        accent = self._generate_color(*ranges['accent'])
+        surface = self._generate_color(*ranges['neutral'])
         
-        surface_match = re.match(r'hsl\((\d+),\s*(\d+)%,\s*(\d+)%\)', surface)
-        surface_lightness = int(surface_match.group(3)) if surface_match else 95
+        surface_hsl = _parse_hsl(surface)
+        surface_lightness = surface_hsl[2] if surface_hsl else 95
         
         if surface_lightness > 50:
-            text = ColorGenerator._hsl_to_string(0, 0, ColorGenerator._generate_odd_value(10, 18))
-            muted = ColorGenerator._hsl_to_string(0, 0, ColorGenerator._generate_odd_value(55, 68))
+            text = ColorGenerator._hsl_to_string(0, 0, self._generate_odd_value(10, 18))
+            muted = ColorGenerator._hsl_to_string(0, 0, self._generate_odd_value(55, 68))
         else:
-            text = ColorGenerator._hsl_to_string(0, 0, ColorGenerator._generate_odd_value(92, 98))
-            muted = ColorGenerator._hsl_to_string(0, 0, ColorGenerator._generate_odd_value(60, 72))
+            text = ColorGenerator._hsl_to_string(0, 0, self._generate_odd_value(92, 98))
+            muted = ColorGenerator._hsl_to_string(0, 0, self._generate_odd_value(60, 72))
         
         primary_dark = ColorGenerator._darken_for_dark_mode(primary, lightness_shift=-5, sat_shift=-12)
         accent_dark = ColorGenerator._darken_for_dark_mode(accent, lightness_shift=-8, sat_shift=-10)
         surface_dark = ColorGenerator._hsl_to_string(
-            int(surface_match.group(1)) if surface_match else 0,
-            ColorGenerator._generate_odd_value(5, 12),
-            ColorGenerator._generate_odd_value(8, 15)
+            surface_hsl[0] if surface_hsl else 0,
+            self._generate_odd_value(5, 12),
+            self._generate_odd_value(8, 15)
         )
-        text_dark = ColorGenerator._hsl_to_string(0, 0, ColorGenerator._generate_odd_value(92, 98))
-        muted_dark = ColorGenerator._hsl_to_string(0, 0, ColorGenerator._generate_odd_value(60, 72))
+        text_dark = ColorGenerator._hsl_to_string(0, 0, self._generate_odd_value(92, 98))
+        muted_dark = ColorGenerator._hsl_to_string(0, 0, self._generate_odd_value(60, 72))
         
         contrasts = {
             'text_on_surface': ColorGenerator._calculate_contrast(text, surface),
@@ -216,38 +250,26 @@ class ColorGenerator:
 
     @staticmethod
     def export_css(palette: ColorPalette) -> str:
-        lines = [
-            f"/* 🎨 {palette.personality.value.upper()} PALETTE */",
-            f"/* Psychology: {palette.psychology} */",
-            "",
-            ":root {",
-            "  /* Light Mode (Default) */",
-            f"  --color-primary: {palette.primary};",
-            f"  --color-accent: {palette.accent};",
-            f"  --color-surface: {palette.surface};",
-            f"  --color-text: {palette.text};",
-            f"  --color-muted: {palette.muted};",
-            "}",
-            "",
-            "@media (prefers-color-scheme: dark) {",
-            "  :root {",
-            f"    --color-primary: {palette.primary_dark};",
-            f"    --color-accent: {palette.accent_dark};",
-            f"    --color-surface: {palette.surface_dark};",
-            f"    --color-text: {palette.text_dark};",
-            f"    --color-muted: {palette.muted_dark};",
-            "  }",
-            "}",
-        ]
-        return "\n".join(lines)
+        return _CSS_TEMPLATE.format_map({**vars(palette), 'name': palette.personality.value.upper()})
+
+@functools.lru_cache(maxsize=256)
+def _generate_seeded(personality: Personality, seed: int) -> ColorPalette:
+    return ColorGenerator(seed).generate(personality)
+
+def generate_seeded(personality: Personality, seed: int) -> ColorPalette:
+    """Reproducible palette for a seed. Repeat requests are served from the cache."""
+    cached = _generate_seeded(personality, seed)
+    # Copy the ratios so callers can't mutate the cached entry
+    return dataclasses.replace(cached, contrast_ratios=dict(cached.contrast_ratios))
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: soul-color <personality> [--export css]")
+        print("Usage: soul-color <personality> [--export css] [--seed N]")
         sys.exit(1)
+    seed = int(sys.argv[sys.argv.index('--seed') + 1]) if '--seed' in sys.argv else None
     try:
         p = Personality(sys.argv[1].lower())
-        palette = ColorGenerator.generate(p)
+        palette = ColorGenerator().generate(p) if seed is None else generate_seeded(p, seed)
         if '--export' in sys.argv and 'css' in sys.argv:
             print(ColorGenerator.export_css(palette))
         else:
@@ -4,6 +4,7 @@
 Final validation - scores how human vs AI-generated your code feels.
 """
 
+import os
 import sys
 import re
 from pathlib import Path
@@ -20,8 +21,13 @@ class ScoreCard:
     microcopy_score: float = 0.0
     verdict: str = ""
 
-AI_COLORS = ['#3B82F6', '#8B5CF6', '#6366F1']
+AI_COLORS_LOWER = frozenset({'#3b82f6', '#8b5cf6', '#6366f1'})
 PERFECT_SPACING = [8, 16, 24, 32, 48, 64]
+SCAN_EXTENSIONS = frozenset({'.css', '.tsx', '.jsx'})
+PRUNE_DIRS = frozenset({'node_modules', '.git', 'dist', '.next', 'build'})
+
+_AI_COLOR_RE = re.compile('|'.join(re.escape(c) for c in sorted(AI_COLORS_LOWER)), re.IGNORECASE)
+_PERFECT_SPACING_RE = re.compile(r'\b(?:' + '|'.join(str(s) for s in PERFECT_SPACING) + r')px\b')
 
 class HumanVsAIScorer:
     def __init__(self, project_path: Path):
@@ -29,18 +35,21 @@ class HumanVsAIScorer:
         self.scorecard = ScoreCard()
 
     def score(self) -> ScoreCard:
-        content = ""
-        for f in self.project_path.rglob('*'):
-            if f.suffix in ['.css', '.tsx', '.jsx'] and 'node_modules' not in str(f):
-                content += f.read_text(errors='ignore')
-        
-        # Simple scoring logic
-        ai_colors = sum(1 for c in AI_COLORS if c.lower() in content.lower())
-        perfect_spacing = sum(1 for s in PERFECT_SPACING if f"{s}px" in content)
+        # Simple scoring logic, tallied per file so the project is never held in memory at once
+        ai_colors, perfect_spacing = set(), set()
+        has_rotation = False
+        for root, dirs, files in os.walk(self.project_path):
+            dirs[:] = [d for d in dirs if d not in PRUNE_DIRS]
+            for name in files:
+                if os.path.splitext(name)[1] in SCAN_EXTENSIONS:
+                    content = Path(root, name).read_text(errors='ignore')
+                    ai_colors.update(m.lower() for m in _AI_COLOR_RE.findall(content))
+                    perfect_spacing.update(_PERFECT_SPACING_RE.findall(content))
+                    has_rotation = has_rotation or 'rotate(' in content
         
-        self.scorecard.color_score = max(0, 100 - (ai_colors * 30))
-        self.scorecard.spacing_score = max(0, 100 - (perfect_spacing * 10))
-        self.scorecard.personality_score = 100 if 'rotate(' in content else 0
+        self.scorecard.color_score = max(0, 100 - (len(ai_colors) * 30))
+        self.scorecard.spacing_score = max(0, 100 - (len(perfect_spacing) * 10))
+        self.scorecard.personality_score = 100 if has_rotation else 0
         
         total = (self.scorecard.color_score + self.scorecard.spacing_score + self.scorecard.personality_score) / 3
         if total > 80: self.scorecard.verdict = "HANDCRAFTED"
@@ -24,6 +24,9 @@ REPLACEMENTS = {
     'Save': { Tone.PLAYFUL: ["Lock it in! 🔒", "Keep it!", "Stash this"], Tone.CASUAL: ["Save it", "Keep this", "Got it"] }
 }
 
+_GENERIC_RE = re.compile(r'>(' + '|'.join(map(re.escape, REPLACEMENTS)) + r')<', re.IGNORECASE)
+_CANONICAL = {generic.lower(): generic for generic in REPLACEMENTS}
+
 class MicrocopyHumanizer:
     def __init__(self, code: str, tone: Tone = Tone.CASUAL):
         self.code = code
@@ -31,14 +34,15 @@ class MicrocopyHumanizer:
         self.replacements_made = []
 
     def humanize(self, preserve_aria: bool = True) -> str:
-        modified_code = self.code
-        for generic, variants in REPLACEMENTS.items():
-            human = random.choice(variants.get(self.tone, variants[Tone.CASUAL]))
-            pattern = rf'>{generic}<'
-            if re.search(pattern, modified_code, re.IGNORECASE):
-                modified_code = re.sub(pattern, f'>{human}<', modified_code, flags=re.IGNORECASE)
-                self.replacements_made.append((generic, human))
-        return modified_code
+        chosen = {}
+        def replace(match):
+            generic = _CANONICAL[match.group(1).lower()]
+            if generic not in chosen:
+                variants = REPLACEMENTS[generic]
+                chosen[generic] = random.choice(variants.get(self.tone, variants[Tone.CASUAL]))
+                self.replacements_made.append((generic, chosen[generic]))
+            return f'>{chosen[generic]}<'
+        return _GENERIC_RE.sub(replace, self.code)
 
 def main():
     if len(sys.argv) < 2: 
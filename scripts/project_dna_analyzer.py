@@ -15,6 +15,7 @@ Usage:
     python project-dna-analyzer.py ./src
     python project-dna-analyzer.py ./src --interactive
     python project-dna-analyzer.py ./src --report dna-report.md
+    python project-dna-analyzer.py ./src --max-file-bytes 500000
 """
 
 import re
@@ -23,8 +24,10 @@ import sys
 import json
 import statistics
 import time
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Tuple, Optional
 from datetime import datetime
@@ -69,6 +72,33 @@ ELITE_DNA_MARKERS = {
     }
 }
 
+def _compile_markers(markers: Dict[str, str]) -> Tuple[Tuple[str, re.Pattern], ...]:
+    """Compile each marker on its own so search() keeps its literal-prefix fast path."""
+    return tuple((key, re.compile(pattern)) for key, pattern in markers.items())
+
+_FEATURE_PATTERNS = _compile_markers(ELITE_DNA_MARKERS['features'])
+_PERSONALITY_PATTERNS = _compile_markers(ELITE_DNA_MARKERS['personality'])
+
+def _detect_markers(patterns: Tuple[Tuple[str, re.Pattern], ...], content: str, known: Set[str] = frozenset()) -> List[str]:
+    """Names of markers present in content, skipping ones already detected elsewhere."""
+    return [key for key, pattern in patterns if key not in known and pattern.search(content)]
+
+# Value Extractors
+_SPACING_RE = re.compile(r'(?:padding|margin|gap|width|height):\s*(\d+)px')
+_DURATION_RE = re.compile(r'(?:duration|transition).*?(\d+)ms')
+_RADIUS_RE = re.compile(r'border-radius:\s*([^;{]+)')
+_AI_SPACING_KEYS = tuple(str(v) for v in AI_SMELL_ATTRS['spacing'])
+_AI_DURATION_KEYS = tuple(str(v) for v in AI_SMELL_ATTRS['durations'])
+_AI_HEX_RE = re.compile('|'.join(re.escape(c) for c in AI_SMELL_ATTRS['colors']), re.IGNORECASE)
+
+# Scan Scope
+SCAN_EXTENSIONS = frozenset({'.css', '.scss', '.tsx', '.jsx', '.ts', '.js', '.vue', '.html'})
+PRUNE_DIRS = frozenset({'node_modules', '.next', '.git', 'dist', 'build'})
+MAX_FILE_BYTES = 2_000_000  # Anything bigger is a bundle, not handcrafted source
+POOL_MIN_BYTES = 1_000_000  # Pool costs ~25 ms to start and pickle; at ~18 MB/s serial, two CPUs only win past ~1 MB
+READ_WORKERS = 8
+READ_AHEAD = 2 * READ_WORKERS  # Files held in memory ahead of the regex thread
+
 # ============================================
 # ANSI COLORS (Matrix/Nuclear Feel)
 # ============================================
@@ -102,9 +132,81 @@ class DesignDNA:
     personality_score: int = 0
     integrity_score: int = 0
 
+    def merge(self, other: 'DesignDNA'):
+        """Fold a partial (per-file) DNA into this one."""
+        self.colors += other.colors
+        self.spacing += other.spacing
+        self.durations += other.durations
+        self.fonts |= other.fonts
+        self.radii += other.radii
+        for key, active in other.features.items():
+            self.features[key] = self.features[key] or active
+        for key, active in other.personality.items():
+            self.personality[key] = self.personality[key] or active
+        self.tech_stack |= other.tech_stack
+        self.ai_smell_count += other.ai_smell_count
+        self.personality_score += other.personality_score
+
+def _read_source(path_str: str) -> Optional[str]:
+    try:
+        return Path(path_str).read_text(encoding='utf-8')
+    except Exception:
+        return None
+
+def scan_text(content: Optional[str], known_features: Set[str] = frozenset()) -> DesignDNA:
+    """Dissect one file's source for design markers.
+
+    Features in known_features were already found elsewhere; only their flag matters, so they are not searched again.
+    """
+    dna = DesignDNA()
+    if content is None:
+        return dna
+    
+    # 1. Tech Stack Detection
+    lowered = content.lower()
+    if 'import' in content and 'react' in lowered: dna.tech_stack.add('React')
+    if 'tailwind' in lowered: dna.tech_stack.add('Tailwind')
+    if 'framer-motion' in content: dna.tech_stack.add('Framer Motion')
+    if 'supabase' in content: dna.tech_stack.add('Supabase')
+
+    # 2. Extract Values
+    dna.spacing.update(_SPACING_RE.findall(content))
+    dna.durations.update(_DURATION_RE.findall(content))
+    dna.radii.update(_RADIUS_RE.findall(content))
+    
+    # 3. Detect Elite Features
+    for key in _detect_markers(_FEATURE_PATTERNS, content, known_features):
+        dna.features[key] = True
+
+    # 4. Detect Personality
+    personality = _detect_markers(_PERSONALITY_PATTERNS, content)
+    for key in personality:
+        dna.personality[key] = True
+    dna.personality_score += 15 * len(personality)
+
+    # 5. Detect AI Smell
+    smells = {m.lower() for m in _AI_HEX_RE.findall(content)}
+    dna.ai_smell_count += 3 * len(smells)
+    return dna
+
+def _read_ahead(executor: ThreadPoolExecutor, paths: List[str], window: int = READ_AHEAD):
+    """Yield file contents in order, keeping at most `window` reads in flight."""
+    pending = deque()
+    for path in paths:
+        pending.append(executor.submit(_read_source, path))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def scan_one(path_str: str) -> DesignDNA:
+    """Read and dissect a single file. Top-level so worker processes can pickle it."""
+    return scan_text(_read_source(path_str))
+
 class EliteAnalyzer:
-    def __init__(self, root_path: str):
+    def __init__(self, root_path: str, max_file_bytes: int = MAX_FILE_BYTES):
         self.root = Path(root_path).resolve()
+        self.max_file_bytes = max_file_bytes
         self.dna = DesignDNA()
         self.files_scanned = 0
         self.start_time = time.time()
@@ -114,64 +216,56 @@ class EliteAnalyzer:
         print(f"\n{G}{BOLD}☢️  NUCLEAR DNA SCAN INITIATED: {self.root}{W}")
         print(f"{C}{'-'*60}{W}")
         
-        extensions = {'.css', '.scss', '.tsx', '.jsx', '.ts', '.js', '.vue', '.html'}
-        
-        for path in self.root.rglob('*'):
-            if any(part in path.parts for part in ['node_modules', '.next', '.git', 'dist', 'build']):
-                continue
-            if path.suffix in extensions:
-                self._analyze_file(path)
-                self.files_scanned += 1
+        paths, total_bytes = self._collect_files()
+        workers = os.cpu_count() or 1
+        if workers > 1 and total_bytes >= POOL_MIN_BYTES:
+            chunksize = max(1, len(paths) // (workers * 4))
+            with multiprocessing.Pool(workers) as pool:
+                for partial in pool.imap_unordered(scan_one, paths, chunksize=chunksize):
+                    self.dna.merge(partial)
+        else:
+            # Reader threads prefetch a bounded window of files (I/O releases the GIL) while this thread runs the regexes
+            with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+                for content in _read_ahead(executor, paths):
+                    known_features = {k for k, v in self.dna.features.items() if v}
+                    self.dna.merge(scan_text(content, known_features))
+        self.files_scanned = len(paths)
 
         self._calculate_scores()
         self._print_terminal_report()
 
-    def _analyze_file(self, path: Path):
-        """Dissect a file for design markers."""
-        try:
-            content = path.read_text(encoding='utf-8')
-            
-            # 1. Tech Stack Detection
-            if 'import' in content and 'react' in content.lower(): self.dna.tech_stack.add('React')
-            if 'tailwind' in content.lower(): self.dna.tech_stack.add('Tailwind')
-            if 'framer-motion' in content: self.dna.tech_stack.add('Framer Motion')
-            if 'supabase' in content: self.dna.tech_stack.add('Supabase')
-
-            # 2. Extract Values
-            self.dna.spacing.update(re.findall(r'(?:padding|margin|gap|width|height):\s*(\d+)px', content))
-            self.dna.durations.update(re.findall(r'(?:duration|transition).*?(\d+)ms', content))
-            self.dna.radii.update(re.findall(r'border-radius:\s*([^;{]+)', content))
-            
-            # 3. Detect Elite Features
-            for key, pattern in ELITE_DNA_MARKERS['features'].items():
-                if re.search(pattern, content):
-                    self.dna.features[key] = True
-                    self.dna.elite_marker_count += 2
-
-            # 4. Detect Personality
-            for key, pattern in ELITE_DNA_MARKERS['personality'].items():
-                if re.search(pattern, content):
-                    self.dna.personality[key] = True
-                    self.dna.personality_score += 15
-
-            # 5. Detect AI Smell
-            for color, name in AI_SMELL_ATTRS['colors'].items():
-                if color.lower() in content.lower():
-                    self.dna.ai_smell_count += 3
-
-        except Exception as e:
-            pass
+    def _collect_files(self) -> Tuple[List[str], int]:
+        """List scannable source files and their total size, pruning dependency dirs and bundles."""
+        paths = []
+        total_bytes = 0
+        for root, dirs, files in os.walk(self.root):
+            dirs[:] = [d for d in dirs if d not in PRUNE_DIRS]
+            for name in files:
+                stem, ext = os.path.splitext(name)
+                if ext not in SCAN_EXTENSIONS or stem.endswith('.min'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    size = os.stat(path).st_size
+                except OSError:
+                    continue
+                if size > self.max_file_bytes:
+                    continue
+                paths.append(path)
+                total_bytes += size
+        return paths, total_bytes
 
     def _calculate_scores(self):
         """Calculate the final Design DNA scores."""
         # Integrity Score (Avoiding AI defaults)
-        spacing_issues = sum(self.dna.spacing[str(v)] for v in AI_SMELL_ATTRS['spacing'])
-        duration_issues = sum(self.dna.durations[str(v)] for v in AI_SMELL_ATTRS['durations'])
+        spacing_issues = sum(self.dna.spacing[k] for k in _AI_SPACING_KEYS)
+        duration_issues = sum(self.dna.durations[k] for k in _AI_DURATION_KEYS)
         
         penalty = (spacing_issues * 2) + (duration_issues * 2) + (self.dna.ai_smell_count * 5)
         self.dna.integrity_score = max(0, 100 - (penalty // max(1, self.files_scanned)))
         
         # Personality Score
+        self.dna.elite_marker_count = sum(2 for v in self.dna.features.values() if v)
         marker_bonus = sum(10 for v in self.dna.features.values() if v)
         self.dna.personality_score = min(100, self.dna.personality_score + marker_bonus)
 
@@ -247,7 +341,10 @@ class EliteAnalyzer:
 
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
-    analyzer = EliteAnalyzer(target)
+    max_file_bytes = MAX_FILE_BYTES
+    if "--max-file-bytes" in sys.argv:
+        max_file_bytes = int(sys.argv[sys.argv.index("--max-file-bytes") + 1])
+    analyzer = EliteAnalyzer(target, max_file_bytes)
     analyzer.nuclear_scan()
     
     if "--interactive" in sys.argv:
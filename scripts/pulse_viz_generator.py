@@ -18,12 +18,15 @@ Usage:
     pulse-viz data.json --context budget-orbit --theme dark
 """
 
+import io
 import sys
 import json
 import math
 import re
+import bisect
+import functools
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple, TextIO
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -31,6 +34,14 @@ from datetime import datetime
 # NUCLEAR COLOR SYSTEM (HSL-based)
 # ============================================
 
+_HSL_RE = re.compile(r'hsl\((\d+),\s*(\d+)%,\s*(\d+)%\)')
+
+def _parse_hsl(hsl_str: str) -> Optional[Tuple[int, int, int]]:
+    match = _HSL_RE.match(hsl_str)
+    if match:
+        return int(match.group(1)), int(match.group(2)), int(match.group(3))
+    return None
+
 class FinancialColors:
     """Contextual colors based on financial performance"""
     EMERALD_STRONG = "hsl(145, 67%, 42%)"      # Vibrant positive
@@ -39,25 +50,41 @@ class FinancialColors:
     AMBER_CAUTION = "hsl(38, 65%, 52%)"        # Mild negative
     CRIMSON_WARNING = "hsl(0, 72%, 42%)"       # Strong negative
     
+    # Ratio thresholds (ascending) and the color for each band between them
+    _THRESHOLDS = (0.85, 0.95, 1.05, 1.15)
+    _BANDS = (CRIMSON_WARNING, AMBER_CAUTION, SLATE_NEUTRAL, TEAL_MILD, EMERALD_STRONG)
+    
     @staticmethod
     def contextual_color(value: float, benchmark: float) -> str:
         ratio = value / benchmark if benchmark != 0 else 1.0
-        if ratio >= 1.15: return FinancialColors.EMERALD_STRONG
-        elif ratio >= 1.05: return FinancialColors.TEAL_MILD
-        elif ratio >= 0.95: return FinancialColors.SLATE_NEUTRAL
-        elif ratio >= 0.85: return FinancialColors.AMBER_CAUTION
-        else: return FinancialColors.CRIMSON_WARNING
+        return FinancialColors._BANDS[bisect.bisect_right(FinancialColors._THRESHOLDS, ratio)]
     
     @staticmethod
     def parse_hsl(hsl_str: str) -> Tuple[int, int, int]:
-        match = re.match(r'hsl\((\d+),\s*(\d+)%,\s*(\d+)%\)', hsl_str)
-        if match: return int(match.group(1)), int(match.group(2)), int(match.group(3))
-        return (0, 0, 0)
+        return _parse_hsl(hsl_str) or (0, 0, 0)
 
 # ============================================
 # CATMULL-ROM SPLINE INTERPOLATION (REAL MATH)
 # ============================================
 
+# Catmull-Rom basis matrix M; rows pair with powers [t^3, t^2, t, 1], columns with p0..p3
+_CATMULL_ROM_BASIS = (
+    (-0.5, 1.5, -1.5, 0.5),
+    (1.0, -2.5, 2.0, -0.5),
+    (-0.5, 0.0, 0.5, 0.0),
+    (0.0, 1.0, 0.0, 0.0),
+)
+
+@functools.lru_cache(maxsize=16)
+def _basis_weights(segments: int) -> Tuple[Tuple[float, float, float, float], ...]:
+    """Rows of T @ M: the p0..p3 weights for each sample t = j / segments. Cached per density."""
+    weights = []
+    for j in range(segments):
+        t = j / segments
+        powers = (t*t*t, t*t, t, 1.0)
+        weights.append(tuple(sum(pw * row[k] for pw, row in zip(powers, _CATMULL_ROM_BASIS)) for k in range(4)))
+    return tuple(weights)
+
 class CatmullRomSpline:
     @staticmethod
     def interpolate(points: List[Tuple[float, float]], segments: int = 20) -> List[Tuple[float, float]]:
@@ -67,16 +94,14 @@ class CatmullRomSpline:
                      points[0][1] + (points[1][1] - points[0][1]) * i / segments) 
                     for i in range(segments + 1)]
         
+        # Basis weights only depend on t, so evaluate them once and reuse them for every segment
+        weights = _basis_weights(segments)
         result = []
         padded = [points[0]] + points + [points[-1]]
         for i in range(len(padded) - 3):
-            p0, p1, p2, p3 = padded[i:i+4]
-            for j in range(segments):
-                t = j / segments
-                t2, t3 = t*t, t*t*t
-                x = 0.5 * ((2*p1[0]) + (-p0[0]+p2[0])*t + (2*p0[0]-5*p1[0]+4*p2[0]-p3[0])*t2 + (-p0[0]+3*p1[1]-3*p2[0]+p3[0])*t3)
-                y = 0.5 * ((2*p1[1]) + (-p0[1]+p2[1])*t + (2*p0[1]-5*p1[1]+4*p2[1]-p3[1])*t2 + (-p0[1]+3*p1[1]-3*p2[1]+p3[1])*t3)
-                result.append((x, y))
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = padded[i:i+4]
+            for w0, w1, w2, w3 in weights:
+                result.append((w0*x0 + w1*x1 + w2*x2 + w3*x3, w0*y0 + w1*y1 + w2*y2 + w3*y3))
         result.append(points[-1])
         return result
 
@@ -87,20 +112,61 @@ class CatmullRomSpline:
 class PathSimplifier:
     @staticmethod
     def simplify(points: List[Tuple[float, float]], tolerance: float = 1.0) -> List[Tuple[float, float]]:
-        if len(points) < 3: return points
-        dmax, index = 0, 0
-        for i in range(1, len(points) - 1):
-            d = PathSimplifier._perp_dist(points[i], points[0], points[-1])
-            if d > dmax: dmax, index = d, i
-        if dmax > tolerance:
-            return PathSimplifier.simplify(points[:index+1], tolerance)[:-1] + PathSimplifier.simplify(points[index:], tolerance)
-        return [points[0], points[-1]]
+        n = len(points)
+        if n < 3: return points
+        tol2 = tolerance * tolerance
+        # Test the full span first: a (near-)collinear series exits before any bookkeeping
+        dist, index, chord2 = PathSimplifier._farthest(points, 0, n - 1)
+        if dist*dist <= tol2 * chord2:
+            return [points[0], points[-1]]
+        keep = [False] * n
+        keep[0] = keep[-1] = keep[index] = True
+        stack = [(0, index), (index, n - 1)]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo < 2: continue
+            dist, index, chord2 = PathSimplifier._farthest(points, lo, hi)
+            if dist*dist > tol2 * chord2:
+                keep[index] = True
+                stack.append((lo, index))
+                stack.append((index, hi))
+        return [p for p, k in zip(points, keep) if k]
+
+    @staticmethod
+    def _farthest(points: List[Tuple[float, float]], lo: int, hi: int) -> Tuple[float, int, float]:
+        """Farthest point from the lo-hi chord as (distance * chord length, index, chord length squared)."""
+        (x1, y1), (x2, y2) = points[lo], points[hi]
+        dx, dy = x2 - x1, y2 - y1
+        # The chord terms are fixed per segment, so each point costs one multiply-add.
+        # Distances stay scaled by the chord length; squaring both sides avoids the sqrt.
+        c = x2*y1 - y2*x1
+        # Track the signed extremes and apply the offset and abs() once per segment, not per point
+        top = bottom = -c
+        top_i = bottom_i = 0
+        for i in range(lo + 1, hi):
+            x, y = points[i]
+            d = dy*x - dx*y
+            if d > top: top, top_i = d, i
+            elif d < bottom: bottom, bottom_i = d, i
+        above, below = top + c, -(bottom + c)
+        if above > below or (above == below and top_i < bottom_i):
+            return above, top_i, dx*dx + dy*dy
+        return below, bottom_i, dx*dx + dy*dy
 
     @staticmethod
-    def _perp_dist(p, p1, p2):
-        num = abs((p2[1]-p1[1])*p[0] - (p2[0]-p1[0])*p[1] + p2[0]*p1[1] - p2[1]*p1[0])
-        den = math.sqrt((p2[1]-p1[1])**2 + (p2[0]-p1[0])**2)
-        return num/den if den != 0 else 0
+    def radial_prefilter(points: List[Tuple[float, float]], radius: float) -> List[Tuple[float, float]]:
+        """Drop points within radius of the last kept point. A cheap O(n) pass before simplify()."""
+        if len(points) < 3: return points
+        r2 = radius * radius
+        kept = [points[0]]
+        lx, ly = points[0]
+        for i in range(1, len(points) - 1):
+            x, y = points[i]
+            if (x - lx)**2 + (y - ly)**2 > r2:
+                kept.append(points[i])
+                lx, ly = x, y
+        kept.append(points[-1])
+        return kept
 
 # ============================================
 # SVG PATH GENERATOR (NUCLEAR RENDERING)
@@ -109,23 +175,38 @@ class PathSimplifier:
 class SVGPathGenerator:
     @staticmethod
     def points_to_path(points: List[Tuple[float, float]]) -> str:
-        return "M " + " L ".join(f"{x:.2f} {y:.2f}" for x, y in points)
+        # %-formatting skips the f-string build per point; unpacking keeps lists and other pairs working
+        return "M " + " L ".join(["%.2f %.2f" % (x, y) for x, y in points])
     
     @staticmethod
     def calculate_path_length(points: List[Tuple[float, float]]) -> float:
-        l = 0
-        for i in range(len(points) - 1):
-            l += math.sqrt((points[i+1][0]-points[i][0])**2 + (points[i+1][1]-points[i][1])**2)
-        return l
+        return sum(math.hypot(b[0]-a[0], b[1]-a[1]) for a, b in zip(points, points[1:]))
 
     @staticmethod
     def create_area_path(points: List[Tuple[float, float]], baseline: float) -> str:
         if not points: return ""
         p = f"M {points[0][0]:.2f} {baseline} L {points[0][0]:.2f} {points[0][1]:.2f} "
-        p += " ".join(f"L {x:.2f} {y:.2f}" for x, y in points[1:])
+        p += " ".join(["L %.2f %.2f" % (x, y) for x, y in points[1:]])
         p += f" L {points[-1][0]:.2f} {baseline} Z"
         return p
 
+    @staticmethod
+    def build_all(points: List[Tuple[float, float]], baseline: float) -> Tuple[str, str, float]:
+        """Main path, area path and path length in a single pass over the points."""
+        if not points: return "M ", "", 0
+        coords, area_steps = [], []
+        length = 0
+        px, py = points[0]
+        for x, y in points:
+            coord = "%.2f %.2f" % (x, y)
+            coords.append(coord)
+            area_steps.append("L " + coord)
+            length += math.hypot(x - px, y - py)
+            px, py = x, y
+        main = "M " + " L ".join(coords)
+        area = f"M {points[0][0]:.2f} {baseline} " + " ".join(area_steps) + f" L {px:.2f} {baseline} Z"
+        return main, area, length
+
 # ============================================
 # DATA PROCESSOR
 # ============================================
@@ -148,7 +229,8 @@ class DataProcessor:
         v_range = v_max - v_min
         
         x_step = width / (len(data) - 1) if len(data) > 1 else 0
-        return [(i * x_step, height - ((p.value - v_min) / v_range * height)) for i, p in enumerate(data)]
+        scale = height / v_range
+        return [(i * x_step, height - (v - v_min) * scale) for i, v in enumerate(vals)]
 
 # ============================================
 # VISUALIZATION CONTEXTS
@@ -158,12 +240,16 @@ class NetWorthViz:
     @staticmethod
     def generate(data: List[DataPoint], color: str) -> Dict:
         points = DataProcessor.normalize(data)
-        if len(points) > 500: points = PathSimplifier.simplify(points, 0.5)
+        if len(points) > 500:
+            tolerance = 0.5
+            points = PathSimplifier.radial_prefilter(points, tolerance * 0.5)
+            points = PathSimplifier.simplify(points, tolerance)
         smooth = CatmullRomSpline.interpolate(points, 15)
+        main_path, area_path, path_length = SVGPathGenerator.build_all(smooth, 40)
         return {
-            'main_path': SVGPathGenerator.points_to_path(smooth),
-            'area_path': SVGPathGenerator.create_area_path(smooth, 40),
-            'path_length': SVGPathGenerator.calculate_path_length(smooth),
+            'main_path': main_path,
+            'area_path': area_path,
+            'path_length': path_length,
             'color': color,
             'points': smooth[::max(1, len(smooth)//20)] # Sample for interaction
         }
@@ -174,9 +260,10 @@ class NetWorthViz:
 
 class VueGenerator:
     @staticmethod
-    def generate_net_worth(viz: Dict) -> str:
-        p_json = json.dumps(viz['points'])
-        return f"""<template>
+    def write_net_worth(viz: Dict, fh: TextIO) -> None:
+        """Stream the component to fh, writing the path data without copying it into the template."""
+        color = viz['color']
+        fh.write(f'''<template>
   <div class="pulse-viz">
     <svg viewBox="0 0 100 40" class="pulse-svg">
       <defs>
@@ -185,12 +272,16 @@ class VueGenerator:
           <feComposite in="SourceGraphic" in2="blur" operator="over"/>
         </filter>
         <linearGradient id="areaGrad" x1="0" y1="0" x2="0" y2="1">
-          <stop offset="0%" stop-color="{viz['color']}" stop-opacity="0.3"/>
-          <stop offset="100%" stop-color="{viz['color']}" stop-opacity="0"/>
+          <stop offset="0%" stop-color="{color}" stop-opacity="0.3"/>
+          <stop offset="100%" stop-color="{color}" stop-opacity="0"/>
         </linearGradient>
       </defs>
-      <path d="{viz['area_path']}" fill="url(#areaGrad)" />
-      <path d="{viz['main_path']}" fill="none" stroke="{viz['color']}" stroke-width="1.8" filter="url(#glow)" class="line-animate" 
+      <path d="''')
+        fh.write(viz['area_path'])
+        fh.write('''" fill="url(#areaGrad)" />
+      <path d="''')
+        fh.write(viz['main_path'])
+        fh.write(f'''" fill="none" stroke="{color}" stroke-width="1.8" filter="url(#glow)" class="line-animate" 
         :style="{{ strokeDasharray: {viz['path_length']:.2f}, strokeDashoffset: animating ? {viz['path_length']:.2f} : 0 }}" />
     </svg>
   </div>
@@ -206,7 +297,13 @@ onMounted(() => setTimeout(() => animating.value = false, 100))
 .pulse-viz {{ background: #0f172a; border-radius: 12px; padding: 24px; }}
 .line-animate {{ transition: stroke-dashoffset 1200ms cubic-bezier(0.4, 0, 0.2, 1); }}
 </style>
-"""
+''')
+
+    @staticmethod
+    def generate_net_worth(viz: Dict) -> str:
+        buf = io.StringIO()
+        VueGenerator.write_net_worth(viz, buf)
+        return buf.getvalue()
 
 def main():
     if len(sys.argv) < 2:
@@ -219,14 +316,15 @@ def main():
     
     color = FinancialColors.contextual_color(data[-1].value, data[0].value) if len(data) > 1 else FinancialColors.SLATE_NEUTRAL
     viz = NetWorthViz.generate(data, color)
-    vue = VueGenerator.generate_net_worth(viz)
     
     if '--output' in sys.argv:
         out = Path(sys.argv[sys.argv.index('--output')+1])
-        out.write_text(vue)
+        with out.open('w') as fh:
+            VueGenerator.write_net_worth(viz, fh)
         print(f"✅ Generated {out}")
     else:
-        print(vue)
+        VueGenerator.write_net_worth(viz, sys.stdout)
+        print()
 
 if __name__ == "__main__":
     main()
@@ -12,6 +12,10 @@ from typing import List, Dict, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+_CLASSNAME_RE = re.compile(r'className="([^"]*)"')
+_TAG_RE = re.compile(r'(<\w+)')
+_RNG = random.Random()
+
 class QuirkType(Enum):
     ROTATION = "rotation"
     IRREGULAR_BORDER = "irregular_border"
@@ -38,13 +42,13 @@ class Quirk:
 class QuirkGenerator:
     @staticmethod
     def rotation_quirk() -> Quirk:
-        angle = round(random.uniform(-0.8, 0.8), 1)
+        angle = _RNG.randrange(-8, 9) / 10
         return Quirk(type=QuirkType.ROTATION, code=f"rotate-[{angle}deg]", 
                      description=f"Subtle {angle}deg rotation", line_hint="className")
     
     @staticmethod
     def irregular_border_quirk() -> Quirk:
-        radii = [random.choice([3, 5, 7, 9, 11, 13, 15, 17]) for _ in range(4)]
+        radii = _RNG.choices([3, 5, 7, 9, 11, 13, 15, 17], k=4)
         return Quirk(type=QuirkType.IRREGULAR_BORDER, 
                      code=f"border-radius: {radii[0]}px {radii[1]}px {radii[2]}px {radii[3]}px;", 
                      description=f"Irregular corners: {radii}", line_hint="style")
@@ -52,7 +56,7 @@ class QuirkGenerator:
     @staticmethod
     def irregular_padding_quirk() -> Quirk:
         values = [17, 19, 23, 29, 31, 37, 41, 43]
-        px, py = random.choice(values), random.choice(values)
+        px, py = _RNG.choices(values, k=2)
         return Quirk(type=QuirkType.IRREGULAR_PADDING, code=f"px-[{px}px] py-[{py}px]", 
                      description=f"Irregular padding: {py}px {px}px", line_hint="className")
 
@@ -63,7 +67,11 @@ class QuirkInjector:
 
     def inject_quirks(self, quirk_types: List[QuirkType], level: QuirkLevel = QuirkLevel.MILD) -> str:
         count = {"subtle": 1, "mild": 2, "moderate": 3, "bold": 4}[level.value]
-        modified_code = self.code
+        code = self.code
+        # Each quirk lands at one of two anchors, so find them once and splice everything in a single rebuild
+        class_match = _CLASSNAME_RE.search(code)
+        tag_match = _TAG_RE.search(code)
+        class_parts, style_parts = [], []
         for qt in quirk_types[:count]:
             if qt == QuirkType.ROTATION: q = QuirkGenerator.rotation_quirk()
             elif qt == QuirkType.IRREGULAR_BORDER: q = QuirkGenerator.irregular_border_quirk()
@@ -71,11 +79,23 @@ class QuirkInjector:
             else: continue
             
             if q.line_hint == "className":
-                modified_code = re.sub(r'className="([^"]*)"', rf'className="\1 {q.code}"', modified_code, count=1)
+                class_parts.append(f" {q.code}")
             elif q.line_hint == "style":
-                modified_code = re.sub(r'(<\w+)', rf'\1 style={{{{{q.code.replace(";", "")}}}}}', modified_code, count=1)
+                style_parts.append(f' style={{{{{q.code.replace(";", "")}}}}}')
             self.quirks_applied.append(q)
-        return modified_code
+        
+        # Classes extend the attribute value in order; each style lands right after the tag, newest first
+        insertions = []
+        if class_parts and class_match: insertions.append((class_match.end(1), "".join(class_parts)))
+        if style_parts and tag_match: insertions.append((tag_match.end(), "".join(reversed(style_parts))))
+        
+        out, cursor = [], 0
+        for pos, text in sorted(insertions, key=lambda ins: ins[0]):
+            out.append(code[cursor:pos])
+            out.append(text)
+            cursor = pos
+        out.append(code[cursor:])
+        return "".join(out)
 
 def main():
     if len(sys.argv) < 2: 
@@ -12,6 +12,7 @@ a = (-kx - bv) / m (acceleration)
 import sys
 import math
 import json
+import functools
 from typing import List, Tuple
 from dataclasses import dataclass
 
@@ -38,10 +39,12 @@ class SpringPhysics:
         dt = 1.0 / fps
         frames = int(duration * fps)
         x, v = initial_displacement, 0.0
+        # Fold mass into the per-frame velocity deltas so each step is two multiply-adds
+        k_dt = config.stiffness / config.mass * dt
+        b_dt = config.damping / config.mass * dt
         result = [(0.0, x, v)]
         for frame in range(1, frames):
-            a = (-config.stiffness * x - config.damping * v) / config.mass
-            v += a * dt
+            v -= k_dt * x + b_dt * v
             x += v * dt
             result.append((frame * dt, x, v))
             if abs(x) < 0.01 and abs(v) < 0.01: break
@@ -49,14 +52,19 @@ class SpringPhysics:
 
     @staticmethod
     def analyze(config: SpringConfig) -> dict:
-        zeta = config.damping / (2 * math.sqrt(config.stiffness * config.mass))
-        simulation = SpringPhysics.simulate(config)
-        settle_time = simulation[-1][0]
-        return {
-            "damping_ratio": round(zeta, 3),
-            "settle_time_ms": int(settle_time * 1000),
-            "type": "underdamped" if zeta < 1 else "critical" if zeta == 1 else "overdamped"
-        }
+        # Copy so callers can't mutate the cached entry
+        return dict(_analyze(config.stiffness, config.damping, config.mass))
+
+@functools.lru_cache(maxsize=64)
+def _analyze(stiffness: float, damping: float, mass: float) -> dict:
+    zeta = damping / (2 * math.sqrt(stiffness * mass))
+    simulation = SpringPhysics.simulate(SpringConfig(stiffness, damping, mass))
+    settle_time = simulation[-1][0]
+    return {
+        "damping_ratio": round(zeta, 3),
+        "settle_time_ms": int(settle_time * 1000),
+        "type": "underdamped" if zeta < 1 else "critical" if zeta == 1 else "overdamped"
+    }
 
 def main():
     preset_name = sys.argv[1] if len(sys.argv) > 1 else "snappy"
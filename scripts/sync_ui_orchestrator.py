@@ -229,16 +229,21 @@ class TimelineGenerator:
 # VUE COMPONENT GENERATOR
 # ============================================
 
+# Timelines derive only from STATUS_NARRATIVES, so serialize each context once at import
+_TIMELINES_JSON = {
+    ctx: json.dumps([{
+        'name': p.name,
+        'duration': p.duration,
+        'delay': p.delay,
+        'messages': p.messages
+    } for p in TimelineGenerator.generate_timeline(ctx)], indent=2)
+    for ctx in SyncContext
+}
+
 class VueComponentGenerator:
     @staticmethod
     def generate(context: SyncContext, theme: str = 'dark') -> str:
-        timeline = TimelineGenerator.generate_timeline(context)
-        phases_json = json.dumps([{
-            'name': p.name,
-            'duration': p.duration,
-            'delay': p.delay,
-            'messages': p.messages
-        } for p in timeline], indent=2)
+        phases_json = _TIMELINES_JSON[context]
         
         primary_color = "hsl(165, 67%, 42%)" if context == SyncContext.FLINKS_INITIAL else "hsl(220, 85%, 52%)"
         